@@ -14,6 +14,7 @@ provides validation and context.
 import asyncio
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add src to path
@@ -34,21 +35,73 @@ from src.neo4j_parser import get_schema
 # Initialize MCP server
 server = Server("text2typeql")
 
+# TypeDB connection shared across tool calls, and the validation databases
+# already known to exist on it
+_driver = None
+_ready_databases: set[str] = set()
 
+# Code prefix of TypeDB driver connection errors, e.g. [CXN03]
+CONNECTION_ERROR_CODE = "[CXN"
+
+
+# Static trailer of the convert_queries_batch prompt
+BATCH_OUTPUT_RULES = """
+## Output Format
+Return ONLY valid JSON array, no markdown. Example:
+[
+  {"index": 0, "typeql": "match $p isa person, has name $n; fetch { \\"name\\": $n };"},
+  {"index": 1, "typeql": "match $m isa movie, has title $t; fetch { \\"title\\": $t };"}
+]
+
+## Important TypeQL Syntax Rules
+1. Query order MUST be: match -> sort -> limit -> fetch
+2. Do NOT use $var.* syntax - list attributes explicitly
+3. Use double quotes for strings
+4. For relations: (role1: $var1, role2: $var2) isa relation_name
+5. Bind attributes to variables before using in sort: has attr $a; sort $a desc;
+"""
+
+
+@lru_cache(maxsize=None)
 def load_query_prompt() -> str:
-    """Load the query conversion prompt template."""
+    """Load the query conversion prompt template (read once per server process)."""
     prompt_path = PROMPTS_DIR / "query_conversion.txt"
     return prompt_path.read_text()
 
 
 def get_typedb_driver():
-    """Get TypeDB driver connection."""
+    """Get the shared TypeDB driver connection, (re)connecting if needed."""
+    global _driver
     from typedb.driver import TypeDB, Credentials, DriverOptions
     from src.config import TYPEDB_ADDRESS, TYPEDB_USERNAME, TYPEDB_PASSWORD
 
-    credentials = Credentials(TYPEDB_USERNAME, TYPEDB_PASSWORD)
-    options = DriverOptions(is_tls_enabled=False)
-    return TypeDB.driver(TYPEDB_ADDRESS, credentials, options)
+    if _driver is None or not _driver.is_open():
+        credentials = Credentials(TYPEDB_USERNAME, TYPEDB_PASSWORD)
+        options = DriverOptions(is_tls_enabled=False)
+        _driver = TypeDB.driver(TYPEDB_ADDRESS, credentials, options)
+        _ready_databases.clear()
+    return _driver
+
+
+def reset_typedb_driver():
+    """Drop the shared driver so the next call reconnects."""
+    global _driver
+    if _driver is not None:
+        try:
+            _driver.close()
+        except Exception:
+            pass  # Already unusable; reconnecting is all that matters
+    _driver = None
+    _ready_databases.clear()
+
+
+def count_results(result) -> int:
+    """Count the answers of a resolved query, consuming them."""
+    if result.is_concept_documents():
+        return sum(1 for _ in result.as_concept_documents())
+    if result.is_concept_rows():
+        return sum(1 for _ in result.as_concept_rows())
+    return 0
 
 
 def validate_typeql(database: str, typeql: str) -> dict:
@@ -60,147 +113,150 @@ def validate_typeql(database: str, typeql: str) -> dict:
     try:
         driver = get_typedb_driver()
 
-        # Check if database exists
-        db_exists = any(db.name == db_name for db in driver.databases.all())
-        if not db_exists:
-            # Create database and load schema
-            typeql_schema = load_schema(database)
-            if not typeql_schema:
-                driver.close()
-                return {"valid": False, "error": f"No schema found for {database}"}
+        # Check if database exists (once per connection)
+        if db_name not in _ready_databases:
+            if not any(db.name == db_name for db in driver.databases.all()):
+                # Create database and load schema
+                typeql_schema = load_schema(database)
+                if not typeql_schema:
+                    return {"valid": False, "error": f"No schema found for {database}"}
 
-            driver.databases.create(db_name)
-            with driver.transaction(db_name, TransactionType.SCHEMA) as tx:
-                tx.query(typeql_schema).resolve()
-                tx.commit()
+                driver.databases.create(db_name)
+                with driver.transaction(db_name, TransactionType.SCHEMA) as tx:
+                    tx.query(typeql_schema).resolve()
+                    tx.commit()
+            _ready_databases.add(db_name)
 
         # Try to execute query
         with driver.transaction(db_name, TransactionType.READ) as tx:
             result = tx.query(typeql).resolve()
             # Consume the iterator to ensure query executes
-            if hasattr(result, 'as_concept_documents'):
-                docs = list(result.as_concept_documents())
-                count = len(docs)
-            elif hasattr(result, 'as_aggregate'):
-                count = result.as_aggregate()
-            else:
-                count = 0
-
-        driver.close()
+            count = count_results(result)
+
         return {"valid": True, "result_count": count}
 
     except Exception as e:
         error_msg = str(e)
+        # The database may have been dropped meanwhile; check (and recreate
+        # it) on the next call, as when it was checked every time
+        _ready_databases.discard(db_name)
+        if CONNECTION_ERROR_CODE in error_msg:
+            # A server restart can leave a driver that still reports is_open()
+            reset_typedb_driver()
         # Clean up truncated error messages
         if len(error_msg) > 500:
             error_msg = error_msg[:500] + "..."
         return {"valid": False, "error": error_msg}
 
 
-@server.list_tools()
-async def list_tools():
-    """List available tools."""
-    return [
-        Tool(
-            name="convert_query",
-            description="Get context and prompt for converting a Cypher query to TypeQL. Returns the prompt with schema context that Claude should use for conversion.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database": {
-                        "type": "string",
-                        "description": "Database name (e.g., 'movies', 'companies')"
-                    },
-                    "question": {
-                        "type": "string",
-                        "description": "Natural language question"
-                    },
-                    "cypher": {
-                        "type": "string",
-                        "description": "Cypher query to convert"
-                    },
-                    "previous_error": {
-                        "type": "string",
-                        "description": "Error from previous attempt (for retry)"
-                    },
-                    "previous_typeql": {
-                        "type": "string",
-                        "description": "Previous TypeQL attempt (for retry)"
-                    }
+# Tools exposed by the server; the definitions never change between calls
+TOOLS = [
+    Tool(
+        name="convert_query",
+        description="Get context and prompt for converting a Cypher query to TypeQL. Returns the prompt with schema context that Claude should use for conversion.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database": {
+                    "type": "string",
+                    "description": "Database name (e.g., 'movies', 'companies')"
                 },
-                "required": ["database", "question", "cypher"]
-            }
-        ),
-        Tool(
-            name="convert_queries_batch",
-            description="Get context and prompt for batch converting multiple Cypher queries to TypeQL",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database": {
-                        "type": "string",
-                        "description": "Database name"
-                    },
-                    "queries": {
-                        "type": "array",
-                        "description": "Array of query objects with index, question, cypher, and optional error/typeql for retries",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "index": {"type": "integer"},
-                                "question": {"type": "string"},
-                                "cypher": {"type": "string"},
-                                "typeql": {"type": "string"},
-                                "error": {"type": "string"}
-                            },
-                            "required": ["index", "question", "cypher"]
-                        }
-                    }
+                "question": {
+                    "type": "string",
+                    "description": "Natural language question"
                 },
-                "required": ["database", "queries"]
-            }
-        ),
-        Tool(
-            name="list_databases",
-            description="List available databases with converted schemas",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="validate_typeql",
-            description="Validate a TypeQL query against the TypeDB database with schema loaded",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database": {
-                        "type": "string",
-                        "description": "Database name"
-                    },
-                    "typeql": {
-                        "type": "string",
-                        "description": "TypeQL query to validate"
-                    }
+                "cypher": {
+                    "type": "string",
+                    "description": "Cypher query to convert"
+                },
+                "previous_error": {
+                    "type": "string",
+                    "description": "Error from previous attempt (for retry)"
                 },
-                "required": ["database", "typeql"]
-            }
-        ),
-        Tool(
-            name="get_schema",
-            description="Get the TypeQL schema for a database",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "database": {
-                        "type": "string",
-                        "description": "Database name"
+                "previous_typeql": {
+                    "type": "string",
+                    "description": "Previous TypeQL attempt (for retry)"
+                }
+            },
+            "required": ["database", "question", "cypher"]
+        }
+    ),
+    Tool(
+        name="convert_queries_batch",
+        description="Get context and prompt for batch converting multiple Cypher queries to TypeQL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database": {
+                    "type": "string",
+                    "description": "Database name"
+                },
+                "queries": {
+                    "type": "array",
+                    "description": "Array of query objects with index, question, cypher, and optional error/typeql for retries",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "index": {"type": "integer"},
+                            "question": {"type": "string"},
+                            "cypher": {"type": "string"},
+                            "typeql": {"type": "string"},
+                            "error": {"type": "string"}
+                        },
+                        "required": ["index", "question", "cypher"]
                     }
+                }
+            },
+            "required": ["database", "queries"]
+        }
+    ),
+    Tool(
+        name="list_databases",
+        description="List available databases with converted schemas",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="validate_typeql",
+        description="Validate a TypeQL query against the TypeDB database with schema loaded",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database": {
+                    "type": "string",
+                    "description": "Database name"
                 },
-                "required": ["database"]
-            }
-        )
-    ]
+                "typeql": {
+                    "type": "string",
+                    "description": "TypeQL query to validate"
+                }
+            },
+            "required": ["database", "typeql"]
+        }
+    ),
+    Tool(
+        name="get_schema",
+        description="Get the TypeQL schema for a database",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "database": {
+                    "type": "string",
+                    "description": "Database name"
+                }
+            },
+            "required": ["database"]
+        }
+    )
+]
+
+
+@server.list_tools()
+async def list_tools():
+    """List available tools."""
+    return TOOLS
 
 
 @server.call_tool()
@@ -282,7 +338,7 @@ Please fix the issue and provide a corrected TypeQL query.
         neo4j_schema = get_schema(database)
         neo4j_schema_json = neo4j_schema.to_json_str()
 
-        prompt = f"""You are an expert at converting Cypher queries to TypeDB 3.x TypeQL queries.
+        parts = [f"""You are an expert at converting Cypher queries to TypeDB 3.x TypeQL queries.
 
 ## TypeQL Schema
 ```typeql
@@ -298,41 +354,27 @@ Please fix the issue and provide a corrected TypeQL query.
 Convert each of the following Cypher queries to valid TypeQL. Return your answers in JSON format as an array of objects with "index" and "typeql" fields.
 
 ## Queries to Convert
-"""
+"""]
         for q in queries:
-            prompt += f"""
+            parts.append(f"""
 ### Query {q['index']}
 Question: {q['question']}
 Cypher:
 ```cypher
 {q['cypher']}
 ```
-"""
+""")
             if q.get('error'):
-                prompt += f"""
+                parts.append(f"""
 Previous failed attempt:
 ```typeql
 {q.get('typeql', '')}
 ```
 Error: {q['error'][:500]}
-"""
-
-        prompt += """
-## Output Format
-Return ONLY valid JSON array, no markdown. Example:
-[
-  {"index": 0, "typeql": "match $p isa person, has name $n; fetch { \\"name\\": $n };"},
-  {"index": 1, "typeql": "match $m isa movie, has title $t; fetch { \\"title\\": $t };"}
-]
+""")
 
-## Important TypeQL Syntax Rules
-1. Query order MUST be: match -> sort -> limit -> fetch
-2. Do NOT use $var.* syntax - list attributes explicitly
-3. Use double quotes for strings
-4. For relations: (role1: $var1, role2: $var2) isa relation_name
-5. Bind attributes to variables before using in sort: has attr $a; sort $a desc;
-"""
-        return [TextContent(type="text", text=prompt)]
+        parts.append(BATCH_OUTPUT_RULES)
+        return [TextContent(type="text", text="".join(parts))]
 
     else:
         return [TextContent(type="text", text=f"Unknown tool: {name}")]
@@ -26,41 +26,9 @@ def apply_fix_to_typeql(typeql: str, matched_text: str, validated_fix: str) -> s
     return typeql.replace(matched_text, validated_fix)
 
 
-def apply_fixes_to_database(source: str, database: str, fixes: list[dict], dry_run: bool) -> list[dict]:
-    """Apply fixes to a single database's queries.csv.
-
-    Args:
-        source: Dataset source (e.g., 'synthetic-1')
-        database: Database name
-        fixes: List of fixes for this database
-        dry_run: If True, don't actually modify files
-
-    Returns:
-        List of applied changes with database and original_index
-    """
-    csv_path = f"dataset/{source}/{database}/queries.csv"
-
-    if not os.path.exists(csv_path):
-        print(f"Warning: {csv_path} not found", file=sys.stderr)
-        return []
-
-    # Build a lookup from original_index to list of fixes (may have multiple per query)
-    fix_lookup = {}
-    for fix in fixes:
-        idx = fix['original_index']
-        if idx not in fix_lookup:
-            fix_lookup[idx] = []
-        fix_lookup[idx].append(fix)
-
-    # Read all rows
-    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        rows = list(reader)
-
-    changes = []
-    modified_rows = []
-
-    for row in rows:
+def fix_rows(reader, fix_lookup: dict, database: str, dry_run: bool, changes: list):
+    """Yield each CSV row with its fixes applied, recording changed rows in changes."""
+    for row in reader:
         original_index = int(row.get('original_index', -1))
 
         if original_index in fix_lookup:
@@ -77,7 +45,6 @@ def apply_fixes_to_database(source: str, database: str, fixes: list[dict], dry_r
                 )
 
             if old_typeql != new_typeql:
-                row = dict(row)  # Copy to avoid modifying original
                 row['typeql'] = new_typeql
                 changes.append({
                     'database': database,
@@ -92,21 +59,69 @@ def apply_fixes_to_database(source: str, database: str, fixes: list[dict], dry_r
                         print(f"    Old: {fix['matched_text']}")
                         print(f"    New: {fix['validated_fix']}")
 
-        modified_rows.append(row)
+        yield row
 
-    # Write back atomically (only if not dry run)
-    if not dry_run and changes:
-        dir_path = os.path.dirname(csv_path) or '.'
-        with tempfile.NamedTemporaryFile(
-            mode='w', newline='', encoding='utf-8',
-            delete=False, dir=dir_path
-        ) as tmp:
-            writer = csv.DictWriter(tmp, fieldnames=HEADERS, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(modified_rows)
-            tmp_path = tmp.name
 
+def apply_fixes_to_database(source: str, database: str, fixes: list[dict], dry_run: bool) -> list[dict]:
+    """Apply fixes to a single database's queries.csv.
+
+    Args:
+        source: Dataset source (e.g., 'synthetic-1')
+        database: Database name
+        fixes: List of fixes for this database
+        dry_run: If True, don't actually modify files
+
+    Returns:
+        List of applied changes with database and original_index
+    """
+    csv_path = f"dataset/{source}/{database}/queries.csv"
+
+    if not os.path.exists(csv_path):
+        print(f"Warning: {csv_path} not found", file=sys.stderr)
+        return []
+
+    # Build a lookup from original_index to list of fixes (may have multiple per query)
+    fix_lookup = {}
+    for fix in fixes:
+        idx = fix['original_index']
+        if idx not in fix_lookup:
+            fix_lookup[idx] = []
+        fix_lookup[idx].append(fix)
+
+    changes = []
+
+    with open(csv_path, 'r', newline='', encoding='utf-8') as f:
+        rows = fix_rows(csv.DictReader(f), fix_lookup, database, dry_run, changes)
+
+        if dry_run:
+            # Read-only: only collect the changes
+            for _ in rows:
+                pass
+            return changes
+
+        # Stream rows straight into a temp file next to the CSV; it only
+        # replaces the original when something actually changed.
+        tmp = tempfile.NamedTemporaryFile(
+            mode='w', newline='', encoding='utf-8',
+            delete=False, dir=os.path.dirname(csv_path) or '.'
+        )
+        tmp_path = tmp.name
+
+        try:
+            with tmp:
+                writer = csv.DictWriter(tmp, fieldnames=HEADERS, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(rows)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    # Swap in the rewritten file atomically
+    if changes:
+        shutil.copymode(csv_path, tmp_path)
         shutil.move(tmp_path, csv_path)
+    else:
+        os.unlink(tmp_path)
 
     return changes
 
@@ -7,10 +7,12 @@ import sys
 import json
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 DB = "text2typeql_companies"
 TYPEDB = "/opt/typedb-all-linux-arm64-3.7.3/typedb"
 CONSOLE_ARGS = ["console", "--address", "localhost:1729", "--username", "admin", "--password", "password", "--tls-disabled"]
+WORKERS = 8  # Concurrent console processes
 
 def validate_query(typeql: str) -> tuple[bool, str]:
     """Validate a TypeQL query against TypeDB using a temp file."""
@@ -60,25 +62,37 @@ def main():
 
     print(f"Validating {len(rows)} queries...")
 
+    # Identical queries are only sent to TypeDB once. `unique` lists them in
+    # the order they first appear in `rows`, and executor.map yields results
+    # in that same order, so the first time a row brings an unseen query the
+    # next item of the lazy zip is exactly that query's result.
+    unique = list(dict.fromkeys(row['typeql'] for row in rows))
+    validated = {}
+
     failures = []
-    for i, row in enumerate(rows):
-        idx = row['original_index']
-        typeql = row['typeql']
-
-        success, error = validate_query(typeql)
-
-        if not success:
-            failures.append({
-                'index': idx,
-                'error': error,
-                'question': row['question'],
-                'cypher': row['cypher'],
-                'typeql': typeql
-            })
-            print(f"[{i+1}/{len(rows)}] Index {idx}: FAILED - {error[:80]}")
-        else:
-            if (i+1) % 100 == 0:
-                print(f"[{i+1}/{len(rows)}] Validated {i+1} queries, {len(failures)} failures so far")
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        results = zip(unique, executor.map(validate_query, unique))
+
+        for i, row in enumerate(rows):
+            idx = row['original_index']
+            typeql = row['typeql']
+            if typeql not in validated:
+                typeql_seen, result = next(results)
+                validated[typeql_seen] = result
+            success, error = validated[typeql]
+
+            if not success:
+                failures.append({
+                    'index': idx,
+                    'error': error,
+                    'question': row['question'],
+                    'cypher': row['cypher'],
+                    'typeql': typeql
+                })
+                print(f"[{i+1}/{len(rows)}] Index {idx}: FAILED - {error[:80]}")
+            else:
+                if (i+1) % 100 == 0:
+                    print(f"[{i+1}/{len(rows)}] Validated {i+1} queries, {len(failures)} failures so far")
 
     print(f"\n=== Summary ===")
     print(f"Total: {len(rows)}")
@@ -2,32 +2,41 @@
 """Bulk fix queries for schema changes: in_country -> location-contains."""
 
 import csv
+import os
 import re
+import shutil
+import tempfile
+
+# Both relation spellings in one pattern, so each query is scanned once:
+#   in_country (city: $x, country: $y)      -> group 1
+#   (city: $x, country: $y) isa in_country  -> group 2
+IN_COUNTRY_RELATION = re.compile(
+    r'\bin_country\s*\(([^)]+)\)'
+    r'|\(([^)]+)\)\s*isa\s+in_country\b'
+)
+CITY_ROLE = re.compile(r'\bcity:')
+COUNTRY_ROLE = re.compile(r'\bcountry:')
+ISA_IN_COUNTRY = re.compile(r'\bisa\s+in_country\b')
+
+def rename_roles(content: str) -> str:
+    """Map in_country roles onto location-contains roles."""
+    content = CITY_ROLE.sub('child:', content)
+    content = COUNTRY_ROLE.sub('parent:', content)
+    return content
+
+def replace_in_country(match):
+    """Rewrite a matched in_country relation as location-contains."""
+    if match.group(1) is not None:
+        return f'location-contains ({rename_roles(match.group(1))})'
+    return f'({rename_roles(match.group(2))}) isa location-contains'
 
 def fix_typeql(typeql: str) -> str:
     """Apply schema-related fixes to a TypeQL query."""
-    fixed = typeql
-
-    # Pattern 1: in_country (city: $x, country: $y) -> location-contains (child: $x, parent: $y)
-    def replace_in_country_prefix(match):
-        content = match.group(1)
-        content = re.sub(r'\bcity:', 'child:', content)
-        content = re.sub(r'\bcountry:', 'parent:', content)
-        return f'location-contains ({content})'
-
-    fixed = re.sub(r'\bin_country\s*\(([^)]+)\)', replace_in_country_prefix, fixed)
-
-    # Pattern 2: (city: $x, country: $y) isa in_country -> (child: $x, parent: $y) isa location-contains
-    def replace_in_country_suffix(match):
-        content = match.group(1)
-        content = re.sub(r'\bcity:', 'child:', content)
-        content = re.sub(r'\bcountry:', 'parent:', content)
-        return f'({content}) isa location-contains'
-
-    fixed = re.sub(r'\(([^)]+)\)\s*isa\s+in_country\b', replace_in_country_suffix, fixed)
+    # Patterns 1 and 2: relation with roles, type before or after the roles
+    fixed = IN_COUNTRY_RELATION.sub(replace_in_country, typeql)
 
     # Pattern 3: standalone 'isa in_country' without roles
-    fixed = re.sub(r'\bisa\s+in_country\b', 'isa location-contains', fixed)
+    fixed = ISA_IN_COUNTRY.sub('isa location-contains', fixed)
 
     return fixed
 
@@ -51,11 +60,23 @@ def main():
             fixed_count += 1
             row['typeql'] = fixed
 
-    # Write back to same file with proper quoting
-    with open(input_file, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
-        writer.writeheader()
-        writer.writerows(rows)
+    # Write back to same file with proper quoting (atomic write, so an
+    # interrupted run leaves the original intact)
+    tmp = tempfile.NamedTemporaryFile(mode='w', newline='', delete=False,
+                                      dir=os.path.dirname(input_file) or '.')
+    tmp_path = tmp.name
+
+    try:
+        with tmp:
+            writer = csv.DictWriter(tmp, fieldnames=fieldnames, quoting=csv.QUOTE_ALL)
+            writer.writeheader()
+            writer.writerows(rows)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+    shutil.copymode(input_file, tmp_path)
+    shutil.move(tmp_path, input_file)
 
     print(f"Fixed {fixed_count} queries")
     print(f"Written back to {input_file}")
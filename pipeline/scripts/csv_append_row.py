@@ -13,17 +13,16 @@ HEADERS = {
     'failed_review': ['original_index', 'question', 'cypher', 'typeql', 'review_reason'],
 }
 
+# CSV type for each known filename; anything else is treated as 'queries'
+CSV_TYPES = {
+    'queries.csv': 'queries',
+    'failed.csv': 'failed',
+    'failed_review.csv': 'failed_review',
+}
+
 def get_csv_type(csv_path: str) -> str:
     """Determine CSV type from filename."""
-    basename = os.path.basename(csv_path)
-    if basename == 'queries.csv':
-        return 'queries'
-    elif basename == 'failed.csv':
-        return 'failed'
-    elif basename == 'failed_review.csv':
-        return 'failed_review'
-    else:
-        return 'queries'  # Default
+    return CSV_TYPES.get(os.path.basename(csv_path), 'queries')
 
 def append_row(csv_path: str, row_data: dict) -> bool:
     """Append a row to CSV, creating file with header if needed."""
@@ -44,6 +43,11 @@ def append_row(csv_path: str, row_data: dict) -> bool:
 
         writer.writerow(row_data)
 
+        # Make the row durable before reporting success; agents treat the
+        # printed confirmation as "this conversion is saved"
+        f.flush()
+        os.fsync(f.fileno())
+
     return True
 
 if __name__ == '__main__':
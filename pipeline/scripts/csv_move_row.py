@@ -14,17 +14,16 @@ HEADERS = {
     'failed_review': ['original_index', 'question', 'cypher', 'typeql', 'review_reason'],
 }
 
+# CSV type for each known filename; anything else is treated as 'queries'
+CSV_TYPES = {
+    'queries.csv': 'queries',
+    'failed.csv': 'failed',
+    'failed_review.csv': 'failed_review',
+}
+
 def get_csv_type(csv_path: str) -> str:
     """Determine CSV type from filename."""
-    basename = os.path.basename(csv_path)
-    if basename == 'queries.csv':
-        return 'queries'
-    elif basename == 'failed.csv':
-        return 'failed'
-    elif basename == 'failed_review.csv':
-        return 'failed_review'
-    else:
-        return 'queries'
+    return CSV_TYPES.get(os.path.basename(csv_path), 'queries')
 
 def move_row(source_path: str, dest_path: str, original_index: int, extra_fields: dict = None) -> bool:
     """
@@ -43,20 +42,33 @@ def move_row(source_path: str, dest_path: str, original_index: int, extra_fields
         print(f"Source file not found: {source_path}", file=sys.stderr)
         return False
 
-    # Read source and find the row
+    # Stream the source into a temp file next to it, dropping the moved row;
+    # it only replaces the source if the row was found
     found_row = None
-    remaining_rows = []
-
-    with open(source_path, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        source_headers = reader.fieldnames
-        for row in reader:
-            if int(row.get('original_index', -1)) == original_index:
-                found_row = dict(row)
-            else:
-                remaining_rows.append(row)
+    tmp = tempfile.NamedTemporaryFile(mode='w', newline='', encoding='utf-8',
+                                      delete=False, dir=os.path.dirname(source_path) or '.')
+    tmp_path = tmp.name
+
+    try:
+        with tmp, open(source_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            writer = csv.writer(tmp)
+            source_headers = next(reader, [])
+            writer.writerow(source_headers)
+            index_col = source_headers.index('original_index') if 'original_index' in source_headers else None
+            for row in reader:
+                if not row:
+                    continue  # Blank line, skipped as DictReader does
+                if index_col is not None and int(row[index_col]) == original_index:
+                    found_row = dict(zip(source_headers, row))
+                else:
+                    writer.writerow(row)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
     if not found_row:
+        os.unlink(tmp_path)
         print(f"Row with original_index={original_index} not found in {source_path}", file=sys.stderr)
         return False
 
@@ -64,14 +76,7 @@ def move_row(source_path: str, dest_path: str, original_index: int, extra_fields
     if extra_fields:
         found_row.update(extra_fields)
 
-    # Write remaining rows back to source (atomic write)
-    with tempfile.NamedTemporaryFile(mode='w', newline='', encoding='utf-8',
-                                      delete=False, dir=os.path.dirname(source_path) or '.') as tmp:
-        writer = csv.DictWriter(tmp, fieldnames=source_headers)
-        writer.writeheader()
-        writer.writerows(remaining_rows)
-        tmp_path = tmp.name
-
+    shutil.copymode(source_path, tmp_path)
     shutil.move(tmp_path, source_path)
 
     # Append to destination
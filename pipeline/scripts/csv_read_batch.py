@@ -4,17 +4,20 @@
 import csv
 import json
 import sys
+from itertools import islice
 
 def read_batch(csv_path: str, offset: int, limit: int):
     with open(csv_path, 'r') as f:
         reader = csv.DictReader(f)
-        rows = []
-        for i, row in enumerate(reader):
-            if i < offset:
-                continue
-            if i >= offset + limit:
-                break
-            rows.append(row)
+        if reader.fieldnames is None:  # Reads the header
+            return []
+        # Skip to the offset on the underlying csv.reader so skipped rows stay
+        # plain lists (blank lines are ignored, as DictReader does); the batch
+        # itself comes from DictReader, which pads short rows with None and
+        # keeps extra fields under None
+        for _ in islice((row for row in reader.reader if row), offset):
+            pass
+        rows = list(islice(reader, limit))
     return rows
 
 if __name__ == '__main__':
@@ -7,11 +7,14 @@ import sys
 
 def read_row(csv_path: str, original_index: int) -> dict | None:
     """Read a single row matching original_index from CSV."""
+    # original_index is written as a plain integer, so compare the strings
+    # rather than parsing every row
+    target = str(original_index)
     try:
         with open(csv_path, 'r', newline='', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
-                if int(row.get('original_index', -1)) == original_index:
+                if row.get('original_index') == target:
                     return dict(row)
     except FileNotFoundError:
         return None
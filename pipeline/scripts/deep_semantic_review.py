@@ -5,6 +5,9 @@ import csv
 import json
 import re
 
+# Aggregate-then-filter (HAVING-style) pattern in a lowercased Cypher query
+WITH_COUNT_WHERE = re.compile(r'with\s+\w+.*count.*where', re.DOTALL)
+
 def analyze_query_match(idx, question, cypher, typeql):
     """Analyze if TypeQL correctly implements the question's intent."""
     issues = []
@@ -42,7 +45,7 @@ def analyze_query_match(idx, question, cypher, typeql):
             issues.append(f"Cypher uses COUNT aggregation but TypeQL lacks reduce/count")
 
     # 5. Check for HAVING equivalent (filtering on aggregation)
-    if re.search(r'with\s+\w+.*count.*where', cypher_lower, re.DOTALL):
+    if WITH_COUNT_WHERE.search(cypher_lower):
         issues.append(f"Cypher uses WITH...COUNT...WHERE (HAVING equivalent) - complex aggregation")
 
     # 6. Check for proper sorting with 'most'/'top' queries
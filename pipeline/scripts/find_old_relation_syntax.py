@@ -23,9 +23,9 @@ from datetime import datetime
 # Pattern 1: $var (roles) isa type - old style with isa after roles
 # Example: $r (follower: $a, followed: $b) isa follows
 # This should be: $r isa follows (follower: $a, followed: $b)
+# TypeQL keywords are lowercase-only, so no IGNORECASE is needed
 OLD_STYLE_ISA = re.compile(
     r'\$(\w+)\s*\(([^)]+)\)\s+isa\s+(\w+)',
-    re.IGNORECASE
 )
 
 # Pattern 2: $var (roles) without isa - variable with roles but no relation type
@@ -36,10 +36,24 @@ MISSING_TYPE = re.compile(
     r'\$(\w+)\s*\(([^)]*\w+\s*:\s*\$\w+[^)]*)\)\s*([;,\n])',
 )
 
+# Variables that rule out a MISSING_TYPE finding, collected in one pass per query:
+# type variables ("isa $t (role: $x)") and variables typed elsewhere ("$r isa follows")
+TYPE_VARIABLE = re.compile(r'isa\s+\$(\w+)\s*\(')
+TYPED_VARIABLE = re.compile(r'\$(\w+)\s+isa\s+\w+')
+
+# 'isa' directly after a match, allowing whitespace in between
+ISA_FOLLOWS = re.compile(r'\s*isa')
+
 
 DATABASES = ['twitter', 'twitch', 'movies', 'neoflix', 'recommendations', 'companies', 'gameofthrones']
 
 
+def in_string_literal(typeql: str, pos: int) -> bool:
+    """Crude check for pos being inside a "..." literal, counting quotes before it."""
+    quote_count = typeql.count('"', 0, pos) - typeql.count('\\"', 0, pos)
+    return quote_count % 2 == 1
+
+
 def find_old_syntax_in_query(typeql: str, original_index: int, database: str) -> list[dict]:
     """Find old-style relation syntax patterns in a TypeQL query."""
     findings = []
@@ -51,11 +65,9 @@ def find_old_syntax_in_query(typeql: str, original_index: int, database: str) ->
         rel_type = match.group(3)
         matched_text = match.group(0)
 
-        # Skip if inside a string literal (crude check)
-        before_match = typeql[:match.start()]
-        quote_count = before_match.count('"') - before_match.count('\\"')
-        if quote_count % 2 == 1:
-            continue  # Inside a string literal
+        # Skip if inside a string literal
+        if in_string_literal(typeql, match.start()):
+            continue
 
         # Generate fix: move isa before roles
         suggested_fix = f"${var_name} isa {rel_type} ({roles})"
@@ -71,6 +83,7 @@ def find_old_syntax_in_query(typeql: str, original_index: int, database: str) ->
 
     # Check for missing type pattern (more rare, needs manual review)
     # This is trickier - we need to find $var (roles) patterns that don't have isa
+    type_vars = typed_vars = None
     for match in MISSING_TYPE.finditer(typeql):
         var_name = match.group(1)
         roles = match.group(2)
@@ -78,25 +91,25 @@ def find_old_syntax_in_query(typeql: str, original_index: int, database: str) ->
         end_char = match.group(3)
 
         # Skip if this is actually followed by 'isa' (old style - already caught above)
-        full_match = match.group(0)
-        rest_of_query = typeql[match.end():]
-        if rest_of_query.strip().startswith('isa'):
+        if ISA_FOLLOWS.match(typeql, match.end()):
             continue
 
         # Skip if inside string literal
-        before_match = typeql[:match.start()]
-        quote_count = before_match.count('"') - before_match.count('\\"')
-        if quote_count % 2 == 1:
+        if in_string_literal(typeql, match.start()):
             continue
 
+        if type_vars is None:
+            type_vars = {m.group(1) for m in TYPE_VARIABLE.finditer(typeql)}
+            typed_vars = {m.group(1) for m in TYPED_VARIABLE.finditer(typeql)}
+
         # Skip if this is a type variable (preceded by 'isa $var')
         # e.g., "$rel isa $t (role: $x)" - $t is a type variable, not a relation variable
-        if re.search(rf'isa\s+\${var_name}\s*\(', typeql):
+        if var_name in type_vars:
             continue  # This is a type variable pattern
 
         # Check if this variable is already defined with isa elsewhere
         # Pattern like "$r isa follows" somewhere in query
-        if re.search(rf'\${var_name}\s+isa\s+\w+', typeql):
+        if var_name in typed_vars:
             continue  # Variable already typed elsewhere
 
         # This might be a legitimate pattern (role inference) or a bug
@@ -3,57 +3,21 @@
 Usage: get_batch.py <database> <start_index> <count> [--source synthetic-1|synthetic-2]
 Returns JSON array of {index, question, cypher} objects."""
 
-import csv
 import json
 import sys
+from itertools import islice
+from pathlib import Path
 
-SOURCES = {
-    "synthetic-1": {
-        "csv_path": "/opt/text2typeql/pipeline/data/text2cypher/datasets/synthetic_opus_demodbs/text2cypher_claudeopus.csv",
-        "exclude_column": "false_schema",
-        "exclude_check": "notempty",
-    },
-    "synthetic-2": {
-        "csv_path": "/opt/text2typeql/pipeline/data/text2cypher/datasets/synthetic_gpt4o_demodbs/text2cypher_gpt4o.csv",
-        "exclude_column": "no_cypher",
-        "exclude_check": "true",
-    },
-}
-
-def is_excluded(row: dict, source_config: dict) -> bool:
-    col = source_config["exclude_column"]
-    check = source_config["exclude_check"]
-    value = row.get(col, "")
-    if check == "notempty":
-        return bool(value and str(value).strip())
-    elif check == "true":
-        return str(value).strip().lower() == "true"
-    return False
+# Source definitions and row filtering are shared with get_query.py
+sys.path.insert(0, str(Path(__file__).parent))
+from get_query import SOURCES, iter_valid_queries
 
 def get_batch(database: str, start: int, count: int, source: str = "synthetic-1") -> list:
-    config = SOURCES[source]
-    csv_path = config["csv_path"]
-    results = []
-    with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        idx = 0
-        for row in reader:
-            if row['database'] != database:
-                continue
-            if row.get('syntax_error', '').lower() == 'true':
-                continue
-            if is_excluded(row, config):
-                continue
-            if idx >= start and idx < start + count:
-                results.append({
-                    'index': idx,
-                    'question': row['question'],
-                    'cypher': row['cypher']
-                })
-            if idx >= start + count:
-                break
-            idx += 1
-    return results
+    valid = islice(iter_valid_queries(database, source), start, start + count)
+    return [
+        {'index': idx, 'question': question, 'cypher': cypher}
+        for idx, (question, cypher) in enumerate(valid, start)
+    ]
 
 if __name__ == '__main__':
     source = "synthetic-1"
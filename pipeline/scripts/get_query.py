@@ -4,6 +4,7 @@
 import csv
 import json
 import sys
+from itertools import islice
 
 SOURCES = {
     "synthetic-1": {
@@ -18,40 +19,53 @@ SOURCES = {
     },
 }
 
-def is_excluded(row: dict, source_config: dict) -> bool:
-    col = source_config["exclude_column"]
+# Spellings of a true boolean flag in the source CSVs
+TRUE_VALUES = frozenset({"true", "True", "TRUE"})
+
+def is_excluded(value: str, source_config: dict) -> bool:
     check = source_config["exclude_check"]
-    value = row.get(col, "")
     if check == "notempty":
         return bool(value and str(value).strip())
     elif check == "true":
-        return str(value).strip().lower() == "true"
+        return str(value).strip() in TRUE_VALUES
     return False
 
-def get_query(database: str, index: int, source: str = "synthetic-1") -> dict:
-    """Get query at index for database (0-indexed within valid queries for that db)."""
+def iter_valid_queries(database: str, source: str = "synthetic-1"):
+    """Yield (question, cypher) for each valid query of database, in CSV order.
+
+    Valid means not flagged as a syntax error and not excluded by the
+    source's exclude column; the Nth item yielded is query index N.
+    """
     config = SOURCES[source]
     csv_path = config["csv_path"]
 
     with open(csv_path, 'r') as f:
-        reader = csv.DictReader(f)
-        idx = 0
+        # Positional rows avoid building a dict for every line of the (large) source CSV
+        reader = csv.reader(f)
+        header = next(reader)
+        database_col = header.index('database')
+        question_col = header.index('question')
+        cypher_col = header.index('cypher')
+        syntax_col = header.index('syntax_error') if 'syntax_error' in header else None
+        exclude_col = header.index(config["exclude_column"]) if config["exclude_column"] in header else None
+
         for row in reader:
-            if row['database'] != database:
+            if not row or row[database_col] != database:
                 continue
-            if row.get('syntax_error', '').lower() == 'true':
+            if syntax_col is not None and row[syntax_col] in TRUE_VALUES:
                 continue
-            if is_excluded(row, config):
+            if exclude_col is not None and is_excluded(row[exclude_col], config):
                 continue
+            yield row[question_col], row[cypher_col]
 
-            if idx == index:
-                return {
-                    'index': index,
-                    'question': row['question'],
-                    'cypher': row['cypher']
-                }
-            idx += 1
-
+def get_query(database: str, index: int, source: str = "synthetic-1") -> dict:
+    """Get query at index for database (0-indexed within valid queries for that db)."""
+    for question, cypher in islice(iter_valid_queries(database, source), index, index + 1):
+        return {
+            'index': index,
+            'question': question,
+            'cypher': cypher
+        }
     return None
 
 if __name__ == '__main__':
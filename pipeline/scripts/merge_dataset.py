@@ -9,6 +9,7 @@ Usage:
 
 import csv
 import sys
+from operator import itemgetter
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).parent.parent.parent
@@ -27,9 +28,43 @@ SOURCES_DOMAINS = {
     ],
 }
 
+# Column order of the rows written by merge_source / merge_all
 SOURCE_FIELDS = ["domain", "original_index", "question", "cypher", "typeql"]
 MERGED_FIELDS = ["source", "domain", "original_index", "question", "cypher", "typeql"]
 
+# Output buffer size; rows are streamed from each domain CSV into the merged one
+WRITE_BUFFER = 1 << 17
+
+
+def read_domain_rows(domain_csv: Path):
+    """Yield (original_index, question, cypher, typeql) tuples from a domain queries.csv."""
+    with open(domain_csv, "r") as in_f:
+        reader = csv.reader(in_f)
+        header = next(reader, None)
+        if header is None:
+            return
+        # Column positions come from the header once; rows stay plain lists
+        pick = itemgetter(*map(header.index, SOURCE_FIELDS[1:]))
+        width = len(header)
+        # Short rows are padded with '', as DictReader's None was written
+        for row in reader:
+            if row:
+                yield pick(row + [''] * (width - len(row)))
+
+
+def write_domain_rows(writer, prefix: tuple, domain_csv: Path) -> int:
+    """Stream a domain's rows to writer, each prefixed with prefix; returns the row count."""
+    written = 0
+
+    def prefixed_rows():
+        nonlocal written
+        for row in read_domain_rows(domain_csv):
+            written += 1
+            yield (*prefix, *row)
+
+    writer.writerows(prefixed_rows())
+    return written
+
 
 def merge_source(source: str):
     """Merge all domain queries.csv for a single source."""
@@ -42,9 +77,9 @@ def merge_source(source: str):
     output_path = source_dir / "all_queries.csv"
     total = 0
 
-    with open(output_path, "w", newline="") as out_f:
-        writer = csv.DictWriter(out_f, fieldnames=SOURCE_FIELDS)
-        writer.writeheader()
+    with open(output_path, "w", newline="", buffering=WRITE_BUFFER) as out_f:
+        writer = csv.writer(out_f)
+        writer.writerow(SOURCE_FIELDS)
 
         for domain in domains:
             domain_csv = source_dir / domain / "queries.csv"
@@ -52,21 +87,10 @@ def merge_source(source: str):
                 print(f"  SKIP: {domain_csv} not found", file=sys.stderr)
                 continue
 
-            count = 0
-            with open(domain_csv, "r") as in_f:
-                reader = csv.DictReader(in_f)
-                for row in reader:
-                    writer.writerow({
-                        "domain": domain,
-                        "original_index": row["original_index"],
-                        "question": row["question"],
-                        "cypher": row["cypher"],
-                        "typeql": row["typeql"],
-                    })
-                    count += 1
-
-            print(f"  {domain}: {count} queries")
-            total += count
+            domain_total = write_domain_rows(writer, (domain,), domain_csv)
+
+            print(f"  {domain}: {domain_total} queries")
+            total += domain_total
 
     print(f"  Total: {total} queries -> {output_path}")
     return total
@@ -77,9 +101,9 @@ def merge_all():
     output_path = DATASET_DIR / "all_queries.csv"
     grand_total = 0
 
-    with open(output_path, "w", newline="") as out_f:
-        writer = csv.DictWriter(out_f, fieldnames=MERGED_FIELDS)
-        writer.writeheader()
+    with open(output_path, "w", newline="", buffering=WRITE_BUFFER) as out_f:
+        writer = csv.writer(out_f)
+        writer.writerow(MERGED_FIELDS)
 
         for source, domains in SOURCES_DOMAINS.items():
             source_dir = DATASET_DIR / source
@@ -90,18 +114,7 @@ def merge_all():
                 if not domain_csv.exists():
                     continue
 
-                with open(domain_csv, "r") as in_f:
-                    reader = csv.DictReader(in_f)
-                    for row in reader:
-                        writer.writerow({
-                            "source": source,
-                            "domain": domain,
-                            "original_index": row["original_index"],
-                            "question": row["question"],
-                            "cypher": row["cypher"],
-                            "typeql": row["typeql"],
-                        })
-                        source_total += 1
+                source_total += write_domain_rows(writer, (source, domain), domain_csv)
 
             print(f"{source}: {source_total} queries")
             grand_total += source_total
@@ -2,7 +2,10 @@
 """Helper script for moving queries between CSV files during review."""
 
 import csv
+import os
+import shutil
 import sys
+import tempfile
 
 DEFAULT_SOURCE = "synthetic-1"
 
@@ -12,27 +15,34 @@ def move_to_failed_review(database: str, indices: list[int], reason: str = "", s
     queries_path = f"/opt/text2typeql/dataset/{source}/{database}/queries.csv"
     failed_path = f"/opt/text2typeql/dataset/{source}/{database}/failed_review.csv"
 
-    # Read all queries
-    with open(queries_path, 'r') as f:
-        rows = list(csv.DictReader(f))
-
     indices_set = set(str(i) for i in indices)
 
-    # Separate into keep and move
-    keep = []
+    # Stream queries.csv into a temp file next to it, keeping only the
+    # moved rows in memory, then swap it in atomically
     move = []
-    for row in rows:
-        if row['original_index'] in indices_set:
-            row['review_reason'] = reason
-            move.append(row)
-        else:
-            keep.append(row)
+    kept = 0
+    tmp = tempfile.NamedTemporaryFile(
+        mode='w', newline='', delete=False, dir=os.path.dirname(queries_path)
+    )
+    tmp_path = tmp.name
+
+    try:
+        with tmp, open(queries_path, 'r') as f:
+            writer = csv.DictWriter(tmp, fieldnames=['original_index', 'question', 'cypher', 'typeql'])
+            writer.writeheader()
+            for row in csv.DictReader(f):
+                if row['original_index'] in indices_set:
+                    row['review_reason'] = reason
+                    move.append(row)
+                else:
+                    writer.writerow(row)
+                    kept += 1
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
-    # Write back queries.csv
-    with open(queries_path, 'w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=['original_index', 'question', 'cypher', 'typeql'])
-        writer.writeheader()
-        writer.writerows(keep)
+    shutil.copymode(queries_path, tmp_path)
+    shutil.move(tmp_path, queries_path)
 
     # Append to failed_review.csv
     write_header = True
@@ -50,7 +60,7 @@ def move_to_failed_review(database: str, indices: list[int], reason: str = "", s
         writer.writerows(move)
 
     print(f"Moved {len(move)} queries to failed_review.csv")
-    print(f"Remaining in queries.csv: {len(keep)}")
+    print(f"Remaining in queries.csv: {kept}")
 
 if __name__ == '__main__':
     if len(sys.argv) < 3:
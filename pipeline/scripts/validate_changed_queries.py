@@ -10,28 +10,43 @@ Usage:
 
 import argparse
 import csv
+import hashlib
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import validate_query function from validate_typeql.py
 sys.path.insert(0, str(Path(__file__).parent))
-from validate_typeql import validate_query
+from validate_typeql import validate_query, load_cache, save_cache
 
 
-def get_typeql_from_csv(source: str, database: str, original_index: int) -> str | None:
-    """Read the typeql field for a specific query from queries.csv."""
+def load_typeql_index(source: str, database: str) -> dict[int, str]:
+    """Map original_index to the typeql field for every query in queries.csv."""
     csv_path = f"dataset/{source}/{database}/queries.csv"
+    index = {}
 
     try:
         with open(csv_path, 'r', newline='', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             for row in reader:
-                if int(row.get('original_index', -1)) == original_index:
-                    return row.get('typeql')
+                index.setdefault(int(row.get('original_index', -1)), row.get('typeql'))
     except FileNotFoundError:
-        return None
-    return None
+        pass
+    return index
+
+
+def schema_tag(source: str, databases: set[str]) -> str:
+    """Digest of the schemas the queries are validated against."""
+    digest = hashlib.blake2b(digest_size=16)
+    for database in sorted(databases):
+        digest.update(database.encode())
+        try:
+            with open(f"dataset/{source}/{database}/schema.tql", 'rb') as f:
+                digest.update(f.read())
+        except FileNotFoundError:
+            pass
+    return digest.hexdigest()
 
 
 def main():
@@ -39,6 +54,12 @@ def main():
     parser.add_argument('changes_file', help='Path to applied changes JSON')
     parser.add_argument('--output', help='Output JSON file for failures',
                         default='/tmp/validation_failures.json')
+    parser.add_argument('--workers', type=int, default=8,
+                        help='Number of concurrent validations (default: 8)')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Also print a line for every query that validates')
+    parser.add_argument('--cache', help='JSON file to reuse validation results across runs '
+                        '(ignored when any involved schema.tql changed)')
 
     args = parser.parse_args()
 
@@ -56,14 +77,17 @@ def main():
     print(f"Validating {len(changes)} modified queries...")
 
     failures = []
-    successes = 0
 
+    # Look up the updated TypeQL for every change first; validation is
+    # read-only, so the TypeDB round-trips can then run concurrently.
+    pending = []
+    indexes = {}
     for i, change in enumerate(changes, 1):
         database = change['database']
         original_index = change['original_index']
-
-        # Get the updated TypeQL
-        typeql = get_typeql_from_csv(source, database, original_index)
+        if database not in indexes:
+            indexes[database] = load_typeql_index(source, database)
+        typeql = indexes[database].get(original_index)
 
         if not typeql:
             print(f"[{i}/{len(changes)}] {database}:{original_index} - ERROR: Query not found in CSV")
@@ -74,20 +98,30 @@ def main():
             })
             continue
 
-        # Validate against TypeDB
-        success, message = validate_query(database, typeql)
-
-        if success:
-            print(f"[{i}/{len(changes)}] {database}:{original_index} - OK")
-            successes += 1
-        else:
-            print(f"[{i}/{len(changes)}] {database}:{original_index} - FAILED: {message}")
-            failures.append({
-                'database': database,
-                'original_index': original_index,
-                'error': message,
-                'typeql': typeql,
-            })
+        pending.append((i, database, original_index, typeql))
+
+    if args.cache:
+        tag = schema_tag(source, {change['database'] for change in changes})
+        load_cache(args.cache, tag)
+
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        results = executor.map(lambda p: validate_query(p[1], p[3]), pending)
+
+        for (i, database, original_index, typeql), (success, message) in zip(pending, results):
+            if success:
+                if args.verbose:
+                    print(f"[{i}/{len(changes)}] {database}:{original_index} - OK")
+            else:
+                print(f"[{i}/{len(changes)}] {database}:{original_index} - FAILED: {message}")
+                failures.append({
+                    'database': database,
+                    'original_index': original_index,
+                    'error': message,
+                    'typeql': typeql,
+                })
+
+    if args.cache:
+        save_cache(args.cache, tag)
 
     print()
 
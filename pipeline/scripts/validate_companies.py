@@ -2,12 +2,20 @@
 """Validate all companies queries against TypeDB and perform semantic review."""
 
 import csv
+import os
 import subprocess
 import sys
 import re
 import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+WORKERS = 8  # Concurrent console processes
+
+# Aggregate-then-filter (HAVING-style) pattern in a Cypher query
+WITH_COUNT_WHERE = re.compile(r'WITH\s+\w+.*count.*WHERE', re.I | re.DOTALL)
+
 # Results tracking
 validation_failures = []
 semantic_issues = []
@@ -15,9 +23,10 @@ passed_queries = []
 
 def validate_typeql(typeql: str, index: int) -> tuple[bool, str]:
     """Validate TypeQL against TypeDB server."""
-    # Write query to temp file
-    with open('/tmp/test.tql', 'w') as f:
+    # Write query to its own temp file so concurrent calls don't collide
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.tql', delete=False) as f:
         f.write(typeql)
+        temp_file = f.name
 
     # Run TypeDB console
     cmd = [
@@ -27,7 +36,7 @@ def validate_typeql(typeql: str, index: int) -> tuple[bool, str]:
         '--password', 'password',
         '--tls-disabled',
         '--command', 'transaction read text2typeql_companies',
-        '--command', 'source /tmp/test.tql',
+        '--command', f'source {temp_file}',
         '--command', 'close'
     ]
 
@@ -35,10 +44,10 @@ def validate_typeql(typeql: str, index: int) -> tuple[bool, str]:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
         output = result.stdout + result.stderr
 
-        # Check for errors
-        if 'Error' in output or 'error' in output.lower():
+        # Check for errors (case-insensitive, so this also catches 'Error')
+        if 'error' in output.lower():
             # Extract error message
-            error_lines = [l for l in output.split('\n') if 'error' in l.lower() or 'Error' in l]
+            error_lines = [l for l in output.split('\n') if 'error' in l.lower()]
             return False, '\n'.join(error_lines[:3])
 
         return True, ""
@@ -46,6 +55,8 @@ def validate_typeql(typeql: str, index: int) -> tuple[bool, str]:
         return False, "Timeout"
     except Exception as e:
         return False, str(e)
+    finally:
+        os.unlink(temp_file)
 
 def semantic_review(index: int, question: str, cypher: str, typeql: str) -> tuple[bool, str]:
     """Perform semantic review to check if TypeQL matches the question intent."""
@@ -95,7 +106,7 @@ def semantic_review(index: int, question: str, cypher: str, typeql: str) -> tupl
             issues.append("Cypher has OPTIONAL MATCH but TypeQL lacks try/or blocks")
 
     # Check 5: HAVING / aggregation filtering
-    if 'HAVING' in cypher.upper() or (re.search(r'WITH\s+\w+.*count.*WHERE', cypher, re.I|re.DOTALL)):
+    if 'HAVING' in cypher.upper() or WITH_COUNT_WHERE.search(cypher):
         # Check for chained reduce pattern
         if 'reduce' in typeql_lower:
             # Look for match after reduce
@@ -166,39 +177,42 @@ def main():
     print(f"Total queries to review: {len(queries)}")
     print("=" * 60)
 
-    # Process queries
-    for i, row in enumerate(queries):
-        index = int(row['original_index'])
-        question = row['question']
-        cypher = row['cypher']
-        typeql = row['typeql']
-
-        # Progress indicator
-        if (i + 1) % 50 == 0:
-            print(f"Progress: {i + 1}/{len(queries)} queries processed")
-
-        # Step 1: Validate against TypeDB
-        valid, error = validate_typeql(typeql, index)
-
-        if not valid:
-            validation_failures.append({
-                'index': index,
-                'question': question[:100],
-                'error': error
-            })
-            continue
-
-        # Step 2: Semantic review
-        sem_valid, sem_issue = semantic_review(index, question, cypher, typeql)
-
-        if not sem_valid:
-            semantic_issues.append({
-                'index': index,
-                'question': question[:100],
-                'issue': sem_issue
-            })
-        else:
-            passed_queries.append(index)
+    # Step 1: Validate against TypeDB, several queries in flight at once
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        validations = executor.map(
+            lambda row: validate_typeql(row['typeql'], int(row['original_index'])), queries
+        )
+
+        # Process queries
+        for i, (row, (valid, error)) in enumerate(zip(queries, validations)):
+            index = int(row['original_index'])
+            question = row['question']
+            cypher = row['cypher']
+            typeql = row['typeql']
+
+            # Progress indicator
+            if (i + 1) % 50 == 0:
+                print(f"Progress: {i + 1}/{len(queries)} queries processed")
+
+            if not valid:
+                validation_failures.append({
+                    'index': index,
+                    'question': question[:100],
+                    'error': error
+                })
+                continue
+
+            # Step 2: Semantic review
+            sem_valid, sem_issue = semantic_review(index, question, cypher, typeql)
+
+            if not sem_valid:
+                semantic_issues.append({
+                    'index': index,
+                    'question': question[:100],
+                    'issue': sem_issue
+                })
+            else:
+                passed_queries.append(index)
 
     # Print results
     print("\n" + "=" * 60)
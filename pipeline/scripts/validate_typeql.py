@@ -15,14 +15,141 @@ Examples:
     python3 scripts/validate_typeql.py twitter --file /tmp/query.tql
 """
 
+import hashlib
+import json
 import subprocess
 import sys
 import tempfile
 import os
+import re
+import threading
 
 TYPEDB = "/opt/typedb-all-linux-arm64-3.7.3/typedb"
 CONSOLE_ARGS = ["console", "--address", "localhost:1729", "--username", "admin", "--password", "password", "--tls-disabled"]
 
+# Validation results keyed on a digest of (db_name, canonical query),
+# oldest evicted first; see load_cache/save_cache for persisting them
+CACHE_SIZE = 4096
+_results: dict[str, tuple[bool, str]] = {}
+# validate_query is called from worker threads (validate_changed_queries)
+_results_lock = threading.Lock()
+
+# Console colour codes stripped from the output before parsing it
+ANSI_CODES = re.compile(r'\[(?:1|31|0|33|32|34)m')
+# TypeDB error code prefixes, e.g. [INF2], [QUA1]; a failure carrying one is
+# a real query error, anything else may be the environment (server down,
+# login rejected, timeout) and is never persisted
+ERROR_CODE = re.compile(r'\[(?:INF|QUA|QEX|REP|TYP|SYN)')
+
+WHITESPACE = re.compile(r'\s+')
+# Named variables; the anonymous $_ is excluded, each occurrence being distinct
+VARIABLE = re.compile(r'\$(?!_\b)[A-Za-z_][A-Za-z0-9_]*')
+
+
+def canonicalize(typeql: str) -> str:
+    """Normalize whitespace and rename variables to $v0, $v1, ... in first-seen order.
+
+    Whitespace runs containing a newline become a single newline so that
+    `#` comments still end where they did. Anonymous `$_` is left as is.
+    """
+    typeql = WHITESPACE.sub(lambda m: '\n' if '\n' in m.group() else ' ', typeql.strip())
+    names: dict[str, str] = {}
+    return VARIABLE.sub(lambda m: names.setdefault(m.group(), f"$v{len(names)}"), typeql)
+
+
+BRACKETS = {')': '(', ']': '[', '}': '{'}
+
+
+def bracket_error(typeql: str) -> str | None:
+    """Find unbalanced brackets or an unterminated string without asking TypeDB.
+
+    String literals and `#` comments are skipped. Returns None if the query
+    is structurally balanced.
+    """
+    stack = []
+    quote = None
+    i = 0
+    while i < len(typeql):
+        ch = typeql[i]
+        if quote:
+            if ch == '\\':
+                i += 1
+            elif ch == quote:
+                quote = None
+        elif ch in '"\'':
+            quote = ch
+        elif ch == '#':
+            newline = typeql.find('\n', i)
+            i = len(typeql) if newline == -1 else newline
+        elif ch in '([{':
+            stack.append(ch)
+        elif ch in BRACKETS:
+            if not stack or stack.pop() != BRACKETS[ch]:
+                return f"Unbalanced '{ch}' at position {i}"
+        i += 1
+    if quote:
+        return "Unterminated string literal"
+    if stack:
+        return f"Unclosed '{stack[-1]}'"
+    return None
+
+
+def cache_key(db_name: str, typeql: str, exact: bool = False) -> str:
+    """Digest identifying a query's validation result across runs.
+
+    Successes are stored under the canonical form, so renamed or reformatted
+    copies of a query share them. Failures are stored under the exact text,
+    since their messages name the query's own variables.
+    """
+    kind, text = ("exact", typeql) if exact else ("canonical", canonicalize(typeql))
+    data = f"{kind}\n{db_name}\n{text}".encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def is_persistent(success: bool, message: str) -> bool:
+    """Whether a result holds across runs: a success or a TypeQL error."""
+    return success or ERROR_CODE.search(message) is not None
+
+
+def load_cache(path: str, schema_tag: str) -> int:
+    """Load persisted validation results written under the same schema_tag.
+
+    Returns:
+        Number of results loaded (0 if the file is missing or stale)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return 0
+    if data.get('schema_tag') != schema_tag:
+        return 0
+    # Files written before failures were filtered may hold environment errors
+    results = {
+        key: (success, message)
+        for key, (success, message) in data.get('results', {}).items()
+        if is_persistent(success, message)
+    }
+    # Keep the newest entries if the file holds more than the cache does
+    results = dict(list(results.items())[-CACHE_SIZE:])
+    with _results_lock:
+        _results.update(results)
+        while len(_results) > CACHE_SIZE:
+            _results.pop(next(iter(_results)))
+    return len(results)
+
+
+def save_cache(path: str, schema_tag: str):
+    """Persist successes and TypeQL errors, tagged with schema_tag."""
+    with _results_lock:
+        results = {
+            key: [success, message]
+            for key, (success, message) in _results.items()
+            if is_persistent(success, message)
+        }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'schema_tag': schema_tag, 'results': results}, f)
+
 
 def validate_query(database: str, typeql: str) -> tuple[bool, str]:
     """Validate a TypeQL query against TypeDB.
@@ -35,7 +162,31 @@ def validate_query(database: str, typeql: str) -> tuple[bool, str]:
         (success, message) tuple
     """
     db_name = f"text2typeql_{database}" if not database.startswith("text2typeql_") else database
+    key = cache_key(db_name, typeql)
+    exact_key = cache_key(db_name, typeql, exact=True)
+    with _results_lock:
+        cached = _results.get(key) or _results.get(exact_key)
+    if cached:
+        return cached
+
+    # Structural errors are caught locally, without a console round-trip
+    error = bracket_error(typeql)
+    if error:
+        result = (False, error)
+    else:
+        result = _run_query(db_name, typeql)
+    # The lock is not held while querying, so another thread may have stored
+    # the same result meanwhile; overwriting it is harmless
+    store_key = key if result[0] else exact_key
+    with _results_lock:
+        if store_key not in _results and len(_results) >= CACHE_SIZE:
+            _results.pop(next(iter(_results)))
+        _results[store_key] = result
+    return result
+
 
+def _run_query(db_name: str, typeql: str) -> tuple[bool, str]:
+    """Run a query through the TypeDB console and parse the outcome."""
     # Write query to temp file (avoids shell escaping issues)
     with tempfile.NamedTemporaryFile(mode='w', suffix='.tql', delete=False) as f:
         f.write(typeql)
@@ -56,8 +207,7 @@ def validate_query(database: str, typeql: str) -> tuple[bool, str]:
         output = result.stdout + result.stderr
 
         # Clean ANSI codes
-        for code in ['[1m', '[31m', '[0m', '[33m', '[32m', '[34m']:
-            output = output.replace(code, '')
+        output = ANSI_CODES.sub('', output)
 
         if result.returncode == 0 and "error:" not in output.lower():
             return True, "OK"
@@ -67,7 +217,7 @@ def validate_query(database: str, typeql: str) -> tuple[bool, str]:
             error_lines = []
             for line in lines:
                 # Capture lines with TypeDB error codes or "error:" prefix
-                if any(code in line for code in ['[INF', '[QUA', '[QEX', '[REP', '[TYP', '[SYN']) or \
+                if ERROR_CODE.search(line) or \
                    ('error:' in line.lower() and 'Error executing' not in line):
                     error_lines.append(line.strip())
             if error_lines:
@@ -15,7 +15,7 @@ from .config import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryRecord:
     """A single question/cypher pair from the dataset."""
     question: str
@@ -64,10 +64,9 @@ def parse_schemas(csv_path: Path = None, source: str = DEFAULT_SOURCE) -> dict[s
     df = pd.read_csv(csv_path)
     schemas = {}
 
-    for _, row in df.iterrows():
-        db_name = row['database']
+    for db_name, structured_schema in zip(df['database'], df['structured_schema']):
         # structured_schema is stored as Python dict literal (single quotes)
-        schema_data = ast.literal_eval(row['structured_schema'])
+        schema_data = ast.literal_eval(structured_schema)
 
         schemas[db_name] = Neo4jSchema(
             database=db_name,
@@ -110,8 +109,8 @@ def parse_queries(
         df = df[df['database'] == database]
 
     queries = []
-    for _, row in df.iterrows():
-        row_dict = row.to_dict()
+    # Plain dicts per row; iterrows() would build a pandas Series for each
+    for row in df.to_dict('records'):
         queries.append(QueryRecord(
             question=row['question'],
             cypher=row['cypher'],
@@ -120,7 +119,7 @@ def parse_queries(
             syntax_error=bool(row.get('syntax_error', False)),
             timeout=bool(row.get('timeout', False)),
             returns_results=bool(row.get('returns_results', True)),
-            excluded=is_query_excluded(row_dict, source)
+            excluded=is_query_excluded(row, source)
         ))
 
     return queries